@@ -7,7 +7,17 @@ from configuration files, including flags and numeric functions.
 
 import json
 from pathlib import Path
-from typing import Optional, Set, Union
+from typing import Any, Callable, FrozenSet, Optional, Set, Union
+
+# Decoder for JSON files read as bytes, shared with the parser. orjson comes
+# with the optional "fast-json" extra, stdlib json parses bytes as well.
+json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 
 class ExternalReferences:
@@ -26,6 +36,8 @@ class ExternalReferences:
         """
         self.numeric_refs: Set[str] = set()
         self.flag_refs: Set[str] = set()
+        # Union of both, built on first use
+        self._all_refs: Optional[FrozenSet[str]] = None
 
         # If no config_path is provided, default to externals.json in the module's directory
         if config_path is None:
@@ -43,8 +55,9 @@ class ExternalReferences:
                 # Create empty sets if file doesn't exist
                 return
 
-            with open(self.config_path, "r") as f:
-                config = json.load(f)
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            with open(self.config_path, "rb") as f:
+                config = json_loads(f.read())
 
             # Load numeric references
             numeric_refs = config.get("numeric", [])
@@ -58,13 +71,18 @@ class ExternalReferences:
             print(f"Error loading externals configuration: {e}")
             # Initialize with empty sets on error
 
-    def get_all_references(self) -> Set[str]:
+    def get_all_references(self) -> FrozenSet[str]:
         """Get all valid external references.
 
+        The union is computed once and reused by later calls, e.g. by every
+        structure validation of a diagram.
+
         Returns:
-            Set of all valid external reference names
+            Frozen set of all valid external reference names
         """
-        return self.numeric_refs.union(self.flag_refs)
+        if self._all_refs is None:
+            self._all_refs = frozenset(self.numeric_refs | self.flag_refs)
+        return self._all_refs
 
     def get_numeric_references(self) -> Set[str]:
         """Get all valid numeric external references.
@@ -1,5 +1,9 @@
 import html
-from typing import Dict, Optional
+from collections import defaultdict
+from functools import lru_cache
+import operator
+import re
+from typing import Any, Dict, FrozenSet, List, Optional
 from lxml import etree as ET
 from logging import getLogger
 from pathlib import Path
@@ -17,22 +21,76 @@ from questionnaire_parser.models.diagram import (
     ShapeType,
     ElementMetadata,
     NumericConstraints,
-)
-from questionnaire_parser.exceptions.parsing import (
-    XMLParsingError,
-    MissingEndpointsError,
+    NODE_ADAPTER,
+    SELECT_OPTION_ADAPTER,
+    GROUP_ADAPTER,
+    EDGE_ADAPTER,
+    STYLE_ADAPTER,
 )
 from questionnaire_parser.utils.validation import (
     ValidationCollector,
     ValidationLevel,
     ValidationSeverity,
 )
-
-from questionnaire_parser.utils.validation_messages import EdgeValidationMessage
 from questionnaire_parser.utils.edge_error_handler import EdgeValidationErrorHandler
+from questionnaire_parser.business_rules.external_flags import json_loads
 
 logger = getLogger(__name__)
 
+# One `key=value` (or bare `key`) item of a draw.io style string
+_STYLE_RE = re.compile(r"([^=;]*)(?:=([^;]*))?")
+# Select options are ordered top to bottom, as they appear in draw.io
+_OPTION_ORDER_KEY = operator.attrgetter("geometry.y")
+# Shapes that can be read from a style, by name. List and rectangle are not
+# stored in the style at all. The dict keeps the ShapeType declaration order,
+# which decides between several shape markers in one style.
+_STYLE_SHAPES = {
+    shape_type.value: shape_type
+    for shape_type in ShapeType
+    if shape_type not in (ShapeType.LIST, ShapeType.RECTANGLE)
+}
+_STYLE_SHAPE_RANK = {name: rank for rank, name in enumerate(_STYLE_SHAPES)}
+# Tags of the elements draw.io wraps a cell in when it has custom properties
+_WRAPPER_TAGS = frozenset(("UserObject", "object"))
+
+_unescape = html.unescape
+
+
+def _maybe_unescape(s: str) -> str:
+    """Unescape HTML entities in a label, most labels don't have any"""
+    return _unescape(s) if "&" in s else s
+
+
+# Geometry and Style are frozen, so identical instances can be shared between
+# elements. A diagram typically uses a few dozen distinct styles.
+_EMPTY_GEOMETRY = Geometry()
+
+
+@lru_cache(maxsize=1024)
+def _make_style(
+    fill_color: Optional[str], stroke_color: Optional[str], rounded: bool, dashed: bool
+) -> Style:
+    """Create a Style, or reuse the one created before with the same values"""
+    return STYLE_ADAPTER.validate_python(
+        {
+            "fill_color": fill_color,
+            "stroke_color": stroke_color,
+            "rounded": rounded,
+            "dashed": dashed,
+        }
+    )
+
+
+@lru_cache(maxsize=8)
+def _load_externals(path: str, mtime_ns: int) -> FrozenSet[str]:
+    """Load the allowed external references of an externals file.
+
+    The modification time is part of the cache key, so an edited file is
+    read again.
+    """
+    with open(path, "rb") as f:
+        return frozenset(json_loads(f.read()).get("allowed_externals", []))
+
 
 class DrawIoParser:
     """Parser for converting draw.io XML files into our diagram model."""
@@ -47,17 +105,22 @@ class DrawIoParser:
         self.validator = ValidationCollector(validation_level)
         self.diagram = Diagram(validation_collector=self.validator)
         self.edge_error_handler = EdgeValidationErrorHandler(self.validator)
+        # Parsed style dicts of the cells of the current parse, keyed by id(cell)
+        self._style_cache: Dict[int, Dict[str, str]] = {}
+        # Page IDs of the cells of the current parse, keyed by id(cell)
+        self._page_ids: Dict[int, str] = {}
         # Load external data
         try:
-            with externals_path.open("r") as f:
-                self.allowed_externals = set(json.load(f).get("allowed_externals", []))
+            self.allowed_externals = _load_externals(
+                str(externals_path), externals_path.stat().st_mtime_ns
+            )
         except (FileNotFoundError, json.JSONDecodeError) as e:
             self.validator.add_result(
                 severity=ValidationSeverity.WARNING,
                 message=f"Failed to load externals from {externals_path}: {e}. Assuming empty set.",
                 element_type="Parser",
             )
-            self.allowed_externals = set()
+            self.allowed_externals = frozenset()
 
     def parse_file(
         self, filepath: Path
@@ -71,7 +134,12 @@ class DrawIoParser:
             Tuple of (Diagram, ValidationCollector)
         """
         try:
-            tree = ET.parse(filepath)
+            # Labels and properties are attributes, whitespace-only text between
+            # the elements is never read. draw.io ids are not xml:id, so lxml
+            # need not index them.
+            tree = ET.parse(
+                filepath, ET.XMLParser(remove_blank_text=True, collect_ids=False)
+            )
             root = tree.getroot()
 
             # Save validation report
@@ -112,105 +180,142 @@ class DrawIoParser:
                 return diagram, self.validator
             raise Exception(message)
 
-    def parse_xml(self, root: ET.Element) -> Diagram:
-        """Parse XML content into diagram model"""
-        # First pass: Create all groups
-        self._parse_groups(root)
+    def parse_xml(self, root: ET._Element) -> Diagram:
+        """Parse XML content into diagram model.
+
+        Every mxCell is visited and classified exactly once. The classified
+        cells are then processed per element type, in dependency order: groups,
+        list nodes (multiple choice questions), regular nodes (including rhombus
+        and the select options of list nodes) and finally edges.
+        """
+        self._style_cache = {}
+        self._page_ids = {}
+        try:
+            return self._parse_cells(root)
+        finally:
+            # Release the per-cell caches, they are only valid during this parse
+            self._style_cache = {}
+            self._page_ids = {}
+
+    def _parse_cells(self, root: ET._Element) -> Diagram:
+        """Classify all mxCells of the tree and create the diagram elements.
+
+        The worklists keep a reference to every classified cell, so that the
+        lxml proxies (and therefore the ids used as cache keys) stay alive for
+        the whole parse.
+        """
+        groups, list_nodes, nodes, edges = [], [], [], []
+        page_id = self._find_page_id(root)
+        for cell in root.iter("diagram", "mxCell"):
+            if cell.tag == "diagram":
+                # The cells of a page follow its <diagram> in document order
+                page_id = cell.get("id", "")
+                continue
+
+            is_vertex = cell.get("vertex") == "1"
+            is_edge = self._is_edge(cell)
+            if not (is_vertex or is_edge):
+                continue
+
+            self._page_ids[id(cell)] = page_id
 
-        # Second pass: Create list nodes (multiple choice questions)
-        self._parse_list_nodes(root)
+            # Resolve the UserObject/object wrapper once per cell
+            wrapper = self._get_wrapper(cell)
+            if is_vertex:
+                if self._is_group(cell):
+                    groups.append((cell, wrapper))
+                elif self._is_list_node(cell):
+                    list_nodes.append((cell, wrapper))
+                else:
+                    nodes.append((cell, wrapper))
+            if is_edge:
+                edges.append((cell, wrapper))
+
+        # Create all groups
+        for cell, wrapper in groups:
+            group = self._create_group(cell, wrapper)
+            self.diagram.groups[group.id] = group
+
+        # Ids of the nodes in each group, added to the groups in one go below
+        children_by_group: Dict[str, List[str]] = defaultdict(list)
+
+        # Create list nodes (multiple choice questions)
+        for cell, wrapper in list_nodes:
+            node = self._create_list_node(cell, wrapper)
+            self.diagram.nodes[node.id] = node
+
+            # Add to parent group if applicable
+            parent_id = cell.get("parent")
+            if parent_id in self.diagram.groups:
+                children_by_group[parent_id].append(node.id)
+
+        # Create regular nodes (including rhombus)
+        for cell, wrapper in nodes:
+            # Skip if already processed as list node
+            base_attrs = self._extract_base_attributes(cell, wrapper)
+            if base_attrs["id"] in self.diagram.nodes:
+                continue
+
+            # Check if this is a select option for a list node
+            parent_id = cell.get("parent", "")
+            parent_node = self.diagram.nodes.get(parent_id)
+            if parent_node is not None and parent_node.shape == ShapeType.LIST:
+                self._add_option_to_list(parent_node, cell, wrapper)
+                continue
 
-        # Third pass: Create regular nodes (including rhombus)
-        self._parse_nodes(root)
+            # Create regular node
+            node = self._create_node(cell, wrapper)
+            self.diagram.nodes[node.id] = node
 
-        # Fourth pass: Create edges
-        self._parse_edges(root)
+            # Add to parent group if applicable
+            if parent_id in self.diagram.groups:
+                children_by_group[parent_id].append(node.id)
+
+        for group_id, child_ids in children_by_group.items():
+            self.diagram.groups[group_id].contained_elements = frozenset(child_ids)
+
+        # Sort the options by the `y` value of their `Geometry` to match draw.io order
+        for node in self.diagram.nodes.values():
+            if node.shape == ShapeType.LIST and node.options:
+                node.options.sort(key=_OPTION_ORDER_KEY)
+
+        # Create edges. All nodes and options exist now, pass the diagram to the
+        # edge error handler for context in its messages
+        self.edge_error_handler.set_diagram(self.diagram)
+        for cell, wrapper in edges:
+            edge = self._create_edge(cell, wrapper)
+            if edge:  # Only add if created successfully
+                self.diagram.edges[edge.id] = edge
 
         # Validate diagram structure after parsing
         validated_diagram = Diagram.model_validate(self.diagram)
 
         return validated_diagram
 
-    def _parse_groups(self, root: ET.Element):
-        """First pass: Parse group elements"""
-        for cell in root.iter("mxCell"):
-            if self._is_group(cell):
-                group = self._create_group(cell)
-                self.diagram.groups[group.id] = group
-                # Validate diagram structure after each group is added
-
-    def _parse_list_nodes(self, root: ET.Element):
-        """Second pass: Parse list nodes (multiple choice)"""
-        for cell in root.iter("mxCell"):
-            if self._is_list_node(cell):
-                node = self._create_list_node(cell)
-                self.diagram.nodes[node.id] = node
-
-                # Add to parent group if applicable
-                parent_id = cell.get("parent")
-                if parent_id in self.diagram.groups:
-                    self.diagram.groups[parent_id].contained_elements.add(node.id)
-
-    def _parse_nodes(self, root: ET.Element):
-        """Third pass: Parse regular nodes (including rhombus)"""
-        for cell in root.iter("mxCell"):
-            if self._is_node(cell):
-                # Skip if already processed as list node
-                base_attrs = self._extract_base_attributes(cell)
-                if base_attrs["id"] in self.diagram.nodes:
-                    continue
-
-                # Check if this is a select option for a list node
-                parent_id = cell.get("parent")
-                if parent_id in self.diagram.nodes:
-                    parent_node = self.diagram.nodes[parent_id]
-                    if parent_node.shape == ShapeType.LIST:
-                        self._add_option_to_list(parent_node, cell)
-                        continue
-
-                # Create regular node
-                node = self._create_node(cell)
-                self.diagram.nodes[node.id] = node
-
-                # Add to parent group if applicable
-                if parent_id in self.diagram.groups:
-                    self.diagram.groups[parent_id].contained_elements.add(node.id)
-
-    def _parse_edges(self, root: ET.Element):
-        """Fourth pass: Parse edges"""
-        for cell in root.iter("mxCell"):
-            if self._is_edge(cell):
-                edge = self._create_edge(cell)
-                if edge:  # Only add if created successfully
-                    self.diagram.edges[edge.id] = edge
-
-    def _is_group(self, cell: ET.Element) -> bool:
-        """Check if cell represents a group"""
-        if cell.get("vertex") != "1":
-            return False
-        style = self._parse_style_string(cell.get("style", ""))
+    def _is_group(self, cell: ET._Element) -> bool:
+        """Check if vertex cell represents a group"""
+        style = self._parse_style_string(cell)
         return "swimlane" in style and "childLayout" not in style
 
-    def _is_list_node(self, cell: ET.Element) -> bool:
-        """Check if cell represents a list node"""
-        if cell.get("vertex") != "1":
-            return False
-        style = self._parse_style_string(cell.get("style", ""))
+    def _is_list_node(self, cell: ET._Element) -> bool:
+        """Check if vertex cell represents a list node"""
+        style = self._parse_style_string(cell)
         return "swimlane" in style and style.get("childLayout") == "stackLayout"
 
-    def _is_node(self, cell: ET.Element) -> bool:
-        """Check if cell represents a regular node"""
-        return (
-            cell.get("vertex") == "1"
-            and not self._is_group(cell)
-            and not self._is_list_node(cell)
-        )
-
-    def _is_edge(self, cell: ET.Element) -> bool:
+    def _is_edge(self, cell: ET._Element) -> bool:
         """Check if cell represents an edge"""
         return cell.get("edge") == "1"
 
-    def _extract_base_attributes(self, cell: ET.Element) -> Dict[str, str]:
+    def _get_wrapper(self, cell: ET._Element) -> Optional[ET._Element]:
+        """Get the UserObject/object element wrapping a cell, if any"""
+        parent = cell.getparent()
+        if parent is not None and parent.tag in _WRAPPER_TAGS:
+            return parent
+        return None
+
+    def _extract_base_attributes(
+        self, cell: ET._Element, wrapper: Optional[ET._Element]
+    ) -> Dict[str, Any]:
         """Extract base attributes (id, label, page_id) from a cell element.
 
         If the cell is wrapped in a UserObject/object element, extracts attributes
@@ -218,103 +323,67 @@ class DrawIoParser:
 
         Args:
             cell: The mxCell element to extract attributes from
+            wrapper: The UserObject/object wrapping the cell, None if unwrapped
 
         Returns:
-            Dictionary containing 'id', 'label', and 'page_id'
+            Dictionary containing 'id' (None if missing), 'label', and 'page_id'
         """
-        wrapper = cell.getparent()
-        if wrapper.tag in ("UserObject", "object"):
+        if wrapper is not None:
             return {
                 "id": wrapper.get("id"),
-                "label": html.unescape(wrapper.get("label", "")),
+                "label": _maybe_unescape(wrapper.get("label", "")),
                 "page_id": self._get_page_id(cell),
             }
         else:
             return {
                 "id": cell.get("id"),
-                "label": html.unescape(cell.get("value", "")),
+                "label": _maybe_unescape(cell.get("value", "")),
                 "page_id": self._get_page_id(cell),
             }
 
-    def _get_element_label(
-        self, element_id: Optional[str]
-    ) -> tuple[Optional[str], Optional[str]]:
-        """Get the label and type of an element by its ID, handling all element types.
-
-        Args:
-            element_id: ID of the element to look up
-
-        Returns:
-            A tuple of (label, element_type) where:
-            - label is the text label of the element if found, None otherwise
-            - element_type is a string describing the type ('node', 'group', 'list', 'option', etc.)
-        """
-        if not element_id:
-            return None, None
-
-        # Check if it's a node
-        if element_id in self.diagram.nodes:
-            node = self.diagram.nodes[element_id]
-            node_type = "list" if node.shape == ShapeType.LIST else "node"
-            return node.label, node_type
-
-        # Check if it's a select option (needs to search through list nodes)
-        for node in self.diagram.nodes.values():
-            if node.options:
-                for option in node.options:
-                    if option.id == element_id:
-                        # Return both the option label and its parent list node's label
-                        parent_info = f" (option of '{node.label}')"
-                        return option.label + parent_info, "option"
-
-        # Check if it's a group
-        if element_id in self.diagram.groups:
-            group = self.diagram.groups[element_id]
-            # Include information about contained elements
-            num_elements = len(group.contained_elements)
-            elements_info = f" (group with {num_elements} elements)"
-            return group.label + elements_info, "group"
-
-        # Element not found
-        return None, None
-
-    def _create_group(self, cell: ET.Element) -> Group:
+    def _create_group(self, cell: ET._Element, wrapper: Optional[ET._Element]) -> Group:
         """Create a Group from cell element"""
-        base_attrs = self._extract_base_attributes(cell)
-        metadata = self._extract_metadata(cell)
-        return Group(
-            id=base_attrs["id"],
-            label=base_attrs["label"],
-            page_id=base_attrs["page_id"],
-            metadata=metadata,
-            geometry=self._create_geometry(cell),
-            contained_elements=set(),  # Will be populated when processing nodes
+        base_attrs = self._extract_base_attributes(cell, wrapper)
+        metadata = self._extract_metadata(wrapper)
+        return GROUP_ADAPTER.validate_python(
+            {
+                "id": base_attrs["id"],
+                "label": base_attrs["label"],
+                "page_id": base_attrs["page_id"],
+                "metadata": metadata,
+                "geometry": self._create_geometry(cell),
+                "contained_elements": frozenset(),  # Set after processing nodes
+            }
         )
 
-    def _create_list_node(self, cell: ET.Element) -> Node:
+    def _create_list_node(
+        self, cell: ET._Element, wrapper: Optional[ET._Element]
+    ) -> Node:
         """Create a List node from cell element"""
-        base_attrs = self._extract_base_attributes(cell)
-        metadata = self._extract_metadata(cell)
-        return Node(
-            id=base_attrs["id"],
-            label=base_attrs["label"],
-            page_id=base_attrs["page_id"],
-            metadata=metadata,
-            shape=ShapeType.LIST,
-            geometry=self._create_geometry(cell),
-            style=self._create_style(cell),
-            options=[],  # Will be populated when processing child nodes
+        base_attrs = self._extract_base_attributes(cell, wrapper)
+        metadata = self._extract_metadata(wrapper)
+        return NODE_ADAPTER.validate_python(
+            {
+                "id": base_attrs["id"],
+                "label": base_attrs["label"],
+                "page_id": base_attrs["page_id"],
+                "metadata": metadata,
+                "shape": ShapeType.LIST,
+                "geometry": self._create_geometry(cell),
+                "style": self._create_style(cell),
+                "options": [],  # Will be populated when processing child nodes
+            }
         )
 
-    def _create_node(self, cell: ET.Element) -> Node:
+    def _create_node(self, cell: ET._Element, wrapper: Optional[ET._Element]) -> Node:
         """Create a regular Node from cell element"""
-        base_attrs = self._extract_base_attributes(cell)
+        base_attrs = self._extract_base_attributes(cell, wrapper)
         shape = self._determine_shape(cell)
-        metadata = self._extract_metadata(cell)
+        metadata = self._extract_metadata(wrapper)
 
         # Add numeric constraints for hexagon/ellipse nodes
         if shape in (ShapeType.HEXAGON, ShapeType.ELLIPSE):
-            numeric_constraints = self._extract_numeric_constraints(cell)
+            numeric_constraints = self._extract_numeric_constraints(wrapper)
             if metadata:
                 metadata.numeric_constraints = numeric_constraints
 
@@ -324,47 +393,55 @@ class DrawIoParser:
             if metadata.name in self.allowed_externals:
                 external = True
 
-        return Node(
-            id=base_attrs["id"],
-            label=base_attrs["label"],
-            page_id=base_attrs["page_id"],
-            metadata=metadata,
-            shape=shape,
-            geometry=self._create_geometry(cell),
-            style=self._create_style(cell),
-            external=external,
+        return NODE_ADAPTER.validate_python(
+            {
+                "id": base_attrs["id"],
+                "label": base_attrs["label"],
+                "page_id": base_attrs["page_id"],
+                "metadata": metadata,
+                "shape": shape,
+                "geometry": self._create_geometry(cell),
+                "style": self._create_style(cell),
+                "external": external,
+            }
         )
 
-    def _create_select_option(self, cell: ET.Element) -> SelectOption:
+    def _create_select_option(
+        self, cell: ET._Element, wrapper: Optional[ET._Element]
+    ) -> SelectOption:
         """Create a SelectOption object from cell element"""
-        base_attrs = self._extract_base_attributes(cell)
-
-        return SelectOption(
-            id=base_attrs["id"],
-            label=base_attrs["label"],
-            page_id=base_attrs["page_id"],
-            parent_id=cell.get("parent"),
-            geometry=self._create_geometry(cell),
-            style=self._create_style(cell),
+        base_attrs = self._extract_base_attributes(cell, wrapper)
+
+        return SELECT_OPTION_ADAPTER.validate_python(
+            {
+                "id": base_attrs["id"],
+                "label": base_attrs["label"],
+                "page_id": base_attrs["page_id"],
+                "parent_id": cell.get("parent"),
+                "geometry": self._create_geometry(cell),
+                "style": self._create_style(cell),
+            }
         )
 
-    def _create_edge(self, cell: ET.Element) -> Optional[Edge]:
+    def _create_edge(
+        self, cell: ET._Element, wrapper: Optional[ET._Element]
+    ) -> Optional[Edge]:
         """Create an Edge from cell element"""
-        base_attrs = self._extract_base_attributes(cell)
-        metadata = self._extract_metadata(cell)
-        # pass diagram to the edge error handler
-        self.edge_error_handler.set_diagram(self.diagram)
+        base_attrs = self._extract_base_attributes(cell, wrapper)
+        metadata = self._extract_metadata(wrapper)
 
         try:
-            return Edge(
-                id=base_attrs["id"],
-                label=base_attrs["label"],
-                page_id=base_attrs["page_id"],
-                metadata=metadata,
-                source=cell.get("source"),
-                target=cell.get("target"),
-                # need this for managing flexible validations
-                # validation_collector = self.validator
+            return EDGE_ADAPTER.validate_python(
+                {
+                    "id": base_attrs["id"],
+                    "label": base_attrs["label"],
+                    "page_id": base_attrs["page_id"],
+                    "metadata": metadata,
+                    "source": cell.get("source"),
+                    "target": cell.get("target"),
+                    # need this for managing flexible validations
+                    # validation_collector = self.validator
+                }
             )
         except ValidationError as ve:
             # Error handling done by EdgeValidationErrorHandler
@@ -376,99 +453,111 @@ class DrawIoParser:
             print(f"Unknown edge validation error: {e}")
             return None
 
-    def _determine_shape(self, cell: ET.Element) -> ShapeType:
+    def _determine_shape(self, cell: ET._Element) -> ShapeType:
         """Determine shape type from cell style"""
-        style = self._parse_style_string(cell.get("style", ""))
+        style = self._parse_style_string(cell)
 
-        for shape_type in ShapeType:
-            # Skip list and rectangle as they are not stored as at all in the style dict
-            if shape_type in (ShapeType.LIST, ShapeType.RECTANGLE):
-                continue
+        # 'ellipse' and 'rhombus' are stored as a key in the style dict,
+        # the other shapes as the value of 'shape'
+        names = style.keys() & _STYLE_SHAPES.keys()
+        shape_name = style.get("shape", "")
+        if shape_name in _STYLE_SHAPES:
+            names.add(shape_name)
 
-            # 'ellipse' and 'rhombus' are stored as a key in the style dict
-            if shape_type in style.keys():
-                return shape_type
-            elif style.get("shape") == shape_type:
-                return shape_type
-        # If not specific shape is found, it's rectangle
-        return ShapeType.RECTANGLE
+        if not names:
+            # If not specific shape is found, it's rectangle
+            return ShapeType.RECTANGLE
+        return _STYLE_SHAPES[min(names, key=_STYLE_SHAPE_RANK.__getitem__)]
 
-    def _add_option_to_list(self, list_node: Node, option_cell: ET.Element):
+    def _add_option_to_list(
+        self,
+        list_node: Node,
+        option_cell: ET._Element,
+        wrapper: Optional[ET._Element],
+    ) -> None:
         """Add an option to a list node"""
         if not list_node.options:
             list_node.options = []
-        select_option = self._create_select_option(option_cell)
+        select_option = self._create_select_option(option_cell, wrapper)
         list_node.options.append(select_option)
-        # Sort the options by the `y` value of their `Geometry` attribute to match draw.io order
-        list_node.options.sort(key=lambda option: option.geometry.y)
 
-    def _extract_metadata(self, cell: ET.Element) -> Optional[ElementMetadata]:
-        """Extract metadata from cell or its parent UserObject"""
-        # Check for parent UserObject/object
-        parent = cell.getparent()
-        if parent is not None and parent.tag in ("UserObject", "object"):
+    def _extract_metadata(
+        self, wrapper: Optional[ET._Element]
+    ) -> Optional[ElementMetadata]:
+        """Extract metadata from the UserObject/object wrapping a cell"""
+        if wrapper is not None:
             return ElementMetadata(
-                name=parent.get("name"),
+                name=wrapper.get("name"),
                 # Add other metadata extraction as needed
             )
         return None
 
     def _extract_numeric_constraints(
-        self, cell: ET.Element
+        self, wrapper: Optional[ET._Element]
     ) -> Optional[NumericConstraints]:
         """Extract numeric constraints for hexagon/ellipse nodes"""
-        parent = cell.getparent()
-        if parent is not None and parent.tag in ("UserObject", "object"):
+        if wrapper is not None:
+            min_value = wrapper.get("min_value")
+            max_value = wrapper.get("max_value")
             return NumericConstraints(
-                min_value=(
-                    float(parent.get("min_value")) if parent.get("min_value") else None
-                ),
-                max_value=(
-                    float(parent.get("max_value")) if parent.get("max_value") else None
-                ),
-                constraint_message=parent.get("constraint_message"),
+                min_value=float(min_value) if min_value else None,
+                max_value=float(max_value) if max_value else None,
+                constraint_message=wrapper.get("constraint_message"),
             )
         return None
 
-    def _create_geometry(self, cell: ET.Element) -> Geometry:
+    def _create_geometry(self, cell: ET._Element) -> Geometry:
         """Create Geometry from cell"""
-        geometry = cell.find("mxGeometry")
-        if geometry is not None:
-            return Geometry(
-                x=float(geometry.get("x", 0)),
-                y=float(geometry.get("y", 0)),
-                width=float(geometry.get("width", 0)),
-                height=float(geometry.get("height", 0)),
-            )
-        return Geometry()
+        # iterchildren filters by tag in C, find() goes through ElementPath
+        geometry = next(cell.iterchildren("mxGeometry"), None)
+        if geometry is None:
+            return _EMPTY_GEOMETRY
+        return Geometry(
+            x=float(geometry.get("x", 0)),
+            y=float(geometry.get("y", 0)),
+            width=float(geometry.get("width", 0)),
+            height=float(geometry.get("height", 0)),
+        )
 
-    def _create_style(self, cell: ET.Element) -> Style:
+    def _create_style(self, cell: ET._Element) -> Style:
         """Create Style from cell"""
-        style_dict = self._parse_style_string(cell.get("style", ""))
-        return Style(
-            fill_color=style_dict.get("fillColor"),
-            stroke_color=style_dict.get("strokeColor"),
-            rounded=style_dict.get("rounded", "0") == "1",
-            dashed=style_dict.get("dashed", "0") == "1",
+        style_dict = self._parse_style_string(cell)
+        return _make_style(
+            style_dict.get("fillColor"),
+            style_dict.get("strokeColor"),
+            style_dict.get("rounded", "0") == "1",
+            style_dict.get("dashed", "0") == "1",
         )
 
-    def _parse_style_string(self, style_str: str) -> Dict[str, str]:
-        """Parse draw.io style string into dictionary"""
-        style_dict = {}
-        if style_str:
-            for item in style_str.split(";"):
-                if "=" in item:
-                    key, value = item.split("=", 1)
-                    style_dict[key.strip()] = value.strip()
-                else:
-                    style_dict[item] = ""
+    def _parse_style_string(self, cell: ET._Element) -> Dict[str, str]:
+        """Get the parsed style of a cell, parsing its style string only once per parse"""
+        cell_id = id(cell)
+        style_dict = self._style_cache.get(cell_id)
+        if style_dict is None:
+            style_dict = self._split_style_string(cell.get("style", ""))
+            self._style_cache[cell_id] = style_dict
+        return style_dict
+
+    def _split_style_string(self, style_str: str) -> Dict[str, str]:
+        """Parse draw.io style string into dictionary.
+
+        Bare items (e.g. `ellipse`, `swimlane`) are stored with an empty value.
+        """
+        style_dict: Dict[str, str] = {}
+        for match in _STYLE_RE.finditer(style_str):
+            key = match.group(1).strip()
+            if key:
+                style_dict[key] = (match.group(2) or "").strip()
 
         return style_dict
 
-    def _get_page_id(self, cell: ET.Element) -> str:
-        """Get page ID for element"""
-        # Walk up the tree to find the parent page
-        current = cell
+    def _get_page_id(self, cell: ET._Element) -> str:
+        """Get page ID for a cell of the current parse"""
+        return self._page_ids.get(id(cell), "")
+
+    def _find_page_id(self, element: ET._Element) -> str:
+        """Find the page ID of an element by walking up to its <diagram>"""
+        current: Optional[ET._Element] = element
         while current is not None:
             if current.tag == "diagram":
                 return current.get("id", "")
@@ -2,12 +2,14 @@
 Data model for a diagram without any specific format
 """
 
+from collections import defaultdict
 from enum import Enum
-from typing import Dict, List, Optional, Set, Union
+from typing import Annotated, Dict, FrozenSet, List, Optional, Set, Tuple, Union
 from pydantic import (
+    AfterValidator,
     BaseModel,
     Field,
-    validator,
+    TypeAdapter,
     model_validator,
 )
 from pydantic_core import PydanticCustomError
@@ -15,25 +17,45 @@ from questionnaire_parser.utils.validation import (
     ValidationCollector,
     ValidationSeverity,
 )
-from questionnaire_parser.exceptions.parsing import MissingEndpointsError
 from questionnaire_parser.business_rules.external_flags import ExternalReferences
 
 
+def _validate_positive_dimension(v: float) -> float:
+    """Ensure dimensions are positive numbers"""
+    if v < 0:
+        raise ValueError("Dimensions must be positive numbers")
+    return v
+
+
+def _validate_color_format(v: Optional[str]) -> Optional[str]:
+    """Validate color format if present"""
+    return v if not v or v[0] == "#" else "#" + v
+
+
+def _validate_id_format(v: str) -> str:
+    """Ensure ID is not empty and has valid format"""
+    if not v or not v.strip():
+        raise ValueError("ID cannot be empty")
+    return v.strip()
+
+
+# Field types with their validators attached. pydantic-core calls these plain
+# functions directly, without the wrapper of the deprecated `@validator`.
+Dimension = Annotated[float, AfterValidator(_validate_positive_dimension)]
+Color = Annotated[Optional[str], AfterValidator(_validate_color_format)]
+ElementId = Annotated[str, AfterValidator(_validate_id_format)]
+
+
 class Geometry(BaseModel):
     """Geometric properties of a non-edge diagram element"""
 
     x: float = Field(default=0.0, description="X coordinate")
     y: float = Field(default=0.0, description="Y coordinate")
-    width: float = Field(default=0.0, description="Width of the element")
-    height: float = Field(default=0.0, description="Height of the element")
+    width: Dimension = Field(default=0.0, description="Width of the element")
+    height: Dimension = Field(default=0.0, description="Height of the element")
 
-    @validator("width", "height")
-    @classmethod
-    def validate_positive_dimensions(cls, v):
-        """Ensure dimensions are positive numbers"""
-        if v < 0:
-            raise ValueError("Dimensions must be positive numbers")
-        return v
+    class Config:
+        frozen = True  # Shared between elements, never changed after parsing
 
 
 class ShapeType(str, Enum):
@@ -51,18 +73,13 @@ class ShapeType(str, Enum):
 class Style(BaseModel):
     """Visual style properties of a diagram element"""
 
-    fill_color: Optional[str] = None
-    stroke_color: Optional[str] = None
+    fill_color: Color = None
+    stroke_color: Color = None
     rounded: bool = False
     dashed: bool = False
 
-    @validator("fill_color", "stroke_color")
-    @classmethod
-    def validate_color_format(cls, v):
-        """Validate color format if present"""
-        if v and not v.startswith("#"):
-            v = f"#{v}"
-        return v
+    class Config:
+        frozen = True  # Shared between elements, never changed after parsing
 
 
 class NumericConstraints(BaseModel):
@@ -70,6 +87,9 @@ class NumericConstraints(BaseModel):
     max_value: Optional[float] = None
     constraint_message: Optional[str] = None
 
+    class Config:
+        frozen = True  # Shared between elements, never changed after parsing
+
 
 class ElementMetadata(BaseModel):
     """Non-visual information attached to elements (tags)"""
@@ -87,19 +107,11 @@ class BaseElement(BaseModel):
     This is the base for the three possible types of elements:
     nodes, edges, and containers."""
 
-    id: str
+    id: ElementId
     label: str = ""
     page_id: str = ""  # ID of the page containing the element
     metadata: Optional[ElementMetadata] = None  # Store non-visual information here
 
-    @validator("id")
-    @classmethod
-    def validate_id_format(cls, v):
-        """Ensure ID is not empty and has valid format"""
-        if not v or not v.strip():
-            raise ValueError("ID cannot be empty")
-        return v.strip()
-
 
 class SelectOption(BaseElement):
     """Represents a select-option, which belongs to a list."""
@@ -141,7 +153,8 @@ class Group(BaseElement):
     Beyond the base element properties, a group has a non-empty list
     of contained elements (children)."""
 
-    contained_elements: Set[str] = Field(default_factory=set)
+    # Set by the parser once all nodes are known, read-only afterwards
+    contained_elements: FrozenSet[str] = Field(default_factory=frozenset)
     geometry: Geometry
 
 
@@ -214,56 +227,45 @@ class Diagram(BaseModel):
     @model_validator(mode="after")
     def validate_structure(self) -> "Diagram":
         """Validate overall diagram structure"""
-        # Precompute valid referral nodes (excluding rhombus nodes, including externals)
-        valid_referral_nodes = {
-            n.metadata.name
-            for n in self.nodes.values()
-            if n.metadata and n.metadata.name and n.shape != ShapeType.RHOMBUS
-        } | self.allowed_externals.get_all_references()
-
-        # Precompute valid source IDs
-        valid_node_ids = {
-            node_id
-            for node_id, node in self.nodes.items()
-            if node.shape != ShapeType.LIST
-        }  # Exclude list nodes
-        all_option_ids = {
-            option.id
-            for node in self.nodes.values()
-            if node.shape == ShapeType.LIST and node.options
-            for option in node.options
-        }
-        valid_source_ids = valid_node_ids | all_option_ids  # Union of valid sources
-
-        group_ids = set(self.groups.keys())
-
-        # Validate edge connections
+        # Precompute, in one pass over the nodes:
+        # - valid referral nodes (excluding rhombus nodes, externals are added below)
+        # - valid source IDs (all nodes except list nodes, plus the list options)
+        # - the list and rhombus nodes that need a check of their own
+        valid_referral_nodes: Set[str] = set()
+        valid_source_ids: Set[str] = set()
+        shape_checked_nodes: List[Tuple[str, Node]] = []
+        for node_id, node in self.nodes.items():
+            if node.shape is ShapeType.LIST:
+                if node.options:
+                    valid_source_ids.update(option.id for option in node.options)
+                else:
+                    shape_checked_nodes.append((node_id, node))
+            else:
+                valid_source_ids.add(node_id)
+                if node.shape is ShapeType.RHOMBUS:
+                    shape_checked_nodes.append((node_id, node))
+            if node.metadata and node.metadata.name and node.shape != ShapeType.RHOMBUS:
+                valid_referral_nodes.add(node.metadata.name)
+        valid_referral_nodes.update(self.allowed_externals.get_all_references())
+
+        # Validate edge connections. Most sources are valid, they only cost one
+        # lookup; group ids are never in valid_source_ids
         for edge_id, edge in self.edges.items():
-            if edge.source:
-                if edge.source in group_ids:
+            if edge.source and edge.source not in valid_source_ids:
+                if edge.source in self.groups:
                     message = f"Edge '{edge_id}' has invalid source '{edge.source}' (a group)."
-                    if self.validation_collector:
-                        self.validation_collector.add_result(
-                            severity=ValidationSeverity.ERROR,
-                            message=message,
-                            element_id=edge_id,
-                            element_type="Edge",
-                            field_name="source",
-                        )
-                    else:
-                        raise ValueError(message)
-                elif edge.source not in valid_source_ids:
+                else:
                     message = f"Edge origins from an invalid source '{edge.source}'."
-                    if self.validation_collector:
-                        self.validation_collector.add_result(
-                            severity=ValidationSeverity.ERROR,
-                            message=message,
-                            element_id=edge_id,
-                            element_type="Edge",
-                            field_name="source",
-                        )
-                    else:
-                        raise ValueError(message)
+                if self.validation_collector:
+                    self.validation_collector.add_result(
+                        severity=ValidationSeverity.ERROR,
+                        message=message,
+                        element_id=edge_id,
+                        element_type="Edge",
+                        field_name="source",
+                    )
+                else:
+                    raise ValueError(message)
 
         # Validate group memberships
         for group_id, group in self.groups.items():
@@ -279,9 +281,10 @@ class Diagram(BaseModel):
                 else:
                     raise ValueError(message)
 
-        # Validate list nodes have options
-        for node_id, node in self.nodes.items():
-            if node.shape == ShapeType.LIST and not node.options:
+        # Validate list nodes have options and rhombus references. This needs
+        # the complete referral set, so it runs after the pass over all nodes.
+        for node_id, node in shape_checked_nodes:
+            if node.shape is ShapeType.LIST:
                 message = f"List node {node_id} must have at least one option"
                 if self.validation_collector:
                     self.validation_collector.add_result(
@@ -293,15 +296,13 @@ class Diagram(BaseModel):
                     )
                 else:
                     raise ValueError(message)
-
-        # Validate rhombus references
-        for node_id, node in self.nodes.items():
-            if node.shape == ShapeType.RHOMBUS:
+            else:
                 if not node.metadata or not node.metadata.name:
+                    message = f"Rhombus node {node_id} must reference another node"
                     if self.validation_collector:
                         self.validation_collector.add_result(
                             severity=ValidationSeverity.ERROR,
-                            message=f"Rhombus node {node_id} must reference another node",
+                            message=message,
                             element_id=node_id,
                             element_type="Node",
                             field_name="metadata.name",
@@ -309,10 +310,11 @@ class Diagram(BaseModel):
                     else:
                         raise ValueError(message)
                 elif node.metadata.name not in valid_referral_nodes:
+                    message = f"Rhombus node {node_id} references non-existent node {node.metadata.name}"
                     if self.validation_collector:
                         self.validation_collector.add_result(
                             severity=ValidationSeverity.ERROR,
-                            message=f"Rhombus node {node_id} references non-existent node {node.metadata.name}",
+                            message=message,
                             element_id=node_id,
                             element_type="Node",
                             field_name="metadata.name",
@@ -331,30 +333,46 @@ class Diagram(BaseModel):
 
     def validate_dag(self) -> bool:
         """Verify that the graph is a valid DAG (no cycles)"""
-        visited = set()
-        path = set()
-
-        def dfs(node_id: str) -> bool:
-            if node_id in path:
-                return False
-            if node_id in visited:
-                return True
-
-            path.add(node_id)
-            visited.add(node_id)
-
-            # Check all outgoing edges
-            for edge in self.edges.values():
-                if edge.source_id == node_id:
-                    if not dfs(edge.target):
+        # Targets of the outgoing edges of every element, in one pass over the edges
+        successors: Dict[str, List[str]] = defaultdict(list)
+        for edge in self.edges.values():
+            if edge.source and edge.target:
+                successors[edge.source].append(edge.target)
+
+        visited: Set[str] = set()
+        path: Set[str] = set()
+
+        # Iterative DFS, so long chains don't hit the recursion limit. It starts
+        # from every element with outgoing edges, not only the entry points:
+        # a cycle that no entry point leads to must be found as well.
+        for start in successors:
+            if start in visited:
+                continue
+            visited.add(start)
+            path.add(start)
+            stack = [(start, iter(successors[start]))]
+            while stack:
+                node_id, targets = stack[-1]
+                for target in targets:
+                    if target in path:
                         return False
+                    if target not in visited:
+                        visited.add(target)
+                        path.add(target)
+                        stack.append((target, iter(successors.get(target, ()))))
+                        break
+                else:
+                    # All outgoing edges checked
+                    path.remove(node_id)
+                    stack.pop()
 
-            path.remove(node_id)
-            return True
+        return True
 
-        # Check from all possible entry points
-        for entry_point in self.get_entry_points():
-            if not dfs(entry_point):
-                return False
 
-        return True
+# Validators of the elements built by the parser, set up once at import.
+# validate_python() on a dict skips the keyword packing of the model __init__.
+NODE_ADAPTER = TypeAdapter(Node)
+SELECT_OPTION_ADAPTER = TypeAdapter(SelectOption)
+GROUP_ADAPTER = TypeAdapter(Group)
+EDGE_ADAPTER = TypeAdapter(Edge)
+STYLE_ADAPTER = TypeAdapter(Style)
@@ -1,11 +1,15 @@
-from typing import Optional, Dict
+from collections import Counter
+from typing import Optional, Dict, List
 from pathlib import Path
+import re
 from lxml import etree as ET
 import logging
-from questionnaire_parser.models.diagram import Diagram, ShapeType
+from questionnaire_parser.models.diagram import Diagram
 from questionnaire_parser.core.parser import ValidationLevel
 from questionnaire_parser.core.parser import DrawIoParser
-from questionnaire_parser.core.graph_converter import DAGConverter
+
+# key=value items of a draw.io style string, items without "=" are skipped
+_STYLE_ITEM_RE = re.compile(r"([^=;]*)=([^;]*)")
 
 logger = logging.getLogger(__name__)
 
@@ -26,38 +30,75 @@ def setup_debug_logging(level=logging.INFO):
 
 def print_xml_structure(element: ET.Element, level: int = 0):
     """Print the XML structure in a readable format"""
-    indent = "  " * level
-    print(f"{indent}Tag: {element.tag}")
-
-    # Print attributes
-    if element.attrib:
-        print(f"{indent}Attributes:")
-        for key, value in element.attrib.items():
-            print(f"{indent}  {key}: {value}")
-
-    # Print text content if any
-    if element.text and element.text.strip():
-        print(f"{indent}Text: {element.text.strip()}")
-
-    # Recursively print children
-    for child in element:
-        print_xml_structure(child, level + 1)
+    # Depth-first walk with an explicit stack, so deep documents don't hit
+    # the recursion limit. Children are pushed in reverse to keep their order.
+    stack = [(element, level)]
+    while stack:
+        element, level = stack.pop()
+        indent = "  " * level
+        print(f"{indent}Tag: {element.tag}")
+
+        # Print attributes
+        if element.attrib:
+            print(f"{indent}Attributes:")
+            for key, value in element.attrib.items():
+                print(f"{indent}  {key}: {value}")
+
+        # Print text content if any
+        if element.text and element.text.strip():
+            print(f"{indent}Text: {element.text.strip()}")
+
+        stack.extend((child, level + 1) for child in reversed(element))
+
+
+def stream_xml_structure(xml_path: Path):
+    """Print the XML structure of a file like print_xml_structure, without
+    loading the whole document. Elements are dropped once printed, so memory
+    stays bounded for very large files. Unlike print_xml_structure, comments
+    and processing instructions are not printed."""
+    # Whether the text of each open element still has to be printed
+    text_pending: List[bool] = []
+    for event, element in ET.iterparse(str(xml_path), events=("start", "end")):
+        indent = "  " * len(text_pending)
+        if event == "start":
+            # The text of the parent comes before its first child
+            if text_pending and text_pending[-1]:
+                parent = element.getparent()
+                if parent.text and parent.text.strip():
+                    print(f"{indent[2:]}Text: {parent.text.strip()}")
+                text_pending[-1] = False
+
+            print(f"{indent}Tag: {element.tag}")
+            if element.attrib:
+                print(f"{indent}Attributes:")
+                for key, value in element.attrib.items():
+                    print(f"{indent}  {key}: {value}")
+            text_pending.append(True)
+        else:
+            if text_pending.pop() and element.text and element.text.strip():
+                print(f"{indent[2:]}Text: {element.text.strip()}")
+            # Free the element and the siblings printed before it. The root has
+            # no parent, its previous siblings are top-level comments and PIs.
+            element.clear()
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
 
 
 def inspect_diagram(diagram: Diagram):
     """Print a summary of the parsed diagram"""
-    print("\n=== Diagram Summary ===")
-    print(f"Total nodes: {len(diagram.nodes)}")
-    print(f"Total edges: {len(diagram.edges)}")
-    print(f"Total groups: {len(diagram.groups)}")
-
-    print("\n=== Amount of Node Types ===")
-    node_types: dict[ShapeType, int] = {}
-    for node in diagram.nodes.values():
-        node_type = node.shape.value
-        node_types[node_type] = node_types.get(node_type, 0) + 1
-    for node_type, count in node_types.items():
-        print(f"{node_type}: {count}")
+    # Collect the summary and print it at once
+    lines = [
+        "\n=== Diagram Summary ===",
+        f"Total nodes: {len(diagram.nodes)}",
+        f"Total edges: {len(diagram.edges)}",
+        f"Total groups: {len(diagram.groups)}",
+        "\n=== Amount of Node Types ===",
+    ]
+    node_types = Counter(node.shape.value for node in diagram.nodes.values())
+    lines.extend(f"{node_type}: {count}" for node_type, count in node_types.items())
+    print("\n".join(lines))
 
 
 def inspect_mxcell(
@@ -66,26 +107,24 @@ def inspect_mxcell(
     """Debug information about an mxCell element"""
     cell_id = cell.get("id")
     print(f"\n=== mxCell {cell_id} ===")
-    print("Attributes:", dict(cell.attrib))
+    print("Attributes:", cell.attrib)
 
     # If this cell has a UserObject/object parent, show its attributes
     if parent_map and cell_id in parent_map:
         parent = parent_map[cell_id]
-        print(f"Parent ({parent.tag}) attributes:", dict(parent.attrib))
+        print(f"Parent ({parent.tag}) attributes:", parent.attrib)
 
     # Show geometry if present
     geometry = cell.find("mxGeometry")
     if geometry is not None:
-        print("Geometry:", dict(geometry.attrib))
+        print("Geometry:", geometry.attrib)
 
     # Show style parsed
     style = cell.get("style", "")
     if style:
-        style_dict = {}
-        for item in style.split(";"):
-            if "=" in item:
-                key, value = item.split("=", 1)
-                style_dict[key.strip()] = value.strip()
+        style_dict = {
+            key.strip(): value.strip() for key, value in _STYLE_ITEM_RE.findall(style)
+        }
         print("Parsed style:", style_dict)
 
 
@@ -93,25 +132,23 @@ def examine_node_connections(diagram: Diagram):
     """Analyze node connections and potential issues"""
     print("\n=== Node Connections Analysis ===")
 
+    # Sources and targets of all edges, in one pass over the edges
+    sources = set()
+    targets = set()
+    for edge in diagram.edges.values():
+        sources.add(edge.source)
+        targets.add(edge.target)
+
     # Check for nodes with no incoming edges
     entry_points = diagram.get_entry_points()
     print(f"Entry points (nodes with no incoming edges): {entry_points}")
 
     # Check for nodes with no outgoing edges
-    terminal_nodes = []
-    for node_id in diagram.nodes:
-        has_outgoing = any(edge.source == node_id for edge in diagram.edges.values())
-        if not has_outgoing:
-            terminal_nodes.append(node_id)
+    terminal_nodes = [node_id for node_id in diagram.nodes if node_id not in sources]
     print(f"Terminal nodes (no outgoing edges): {terminal_nodes}")
 
-    # Check for isolated nodes
-    isolated_nodes = []
-    for node_id in diagram.nodes:
-        has_incoming = any(edge.target == node_id for edge in diagram.edges.values())
-        has_outgoing = any(edge.source == node_id for edge in diagram.edges.values())
-        if not has_incoming and not has_outgoing:
-            isolated_nodes.append(node_id)
+    # Check for isolated nodes, they are the terminal nodes without incoming edges
+    isolated_nodes = [node_id for node_id in terminal_nodes if node_id not in targets]
     print(f"Isolated nodes (no connections): {isolated_nodes}")
 
 
@@ -146,6 +183,9 @@ def debug_parsing(
 
 def debug_converting_to_dag(diagram: Diagram, validation_collector):
     """Debug the conversion of a diagram to a directed acyclic graph"""
+    # Imported here, so the parsing helpers don't need the graph stack
+    from questionnaire_parser.core.graph_converter import DAGConverter
+
     print("\n=== Conversion to DAG ===")
     converter = DAGConverter(diagram, validation_collector)
     dag = converter.convert()
@@ -6,10 +6,12 @@ class EdgeValidationErrorHandler:
     def __init__(self, validation_collector, diagram=None):
         self.validator = validation_collector
         self.diagram = diagram
+        self._option_index = None  # select options by ID, built on first use
 
     def set_diagram(self, diagram):
         """Set the diagram reference for context in error messages."""
         self.diagram = diagram
+        self._option_index = None
 
     def handle_edge_error(self, validation_error):
         """Process validation errors from the model and add context.
@@ -20,14 +22,9 @@ class EdgeValidationErrorHandler:
             cell_id: The ID of the cell being processed
         """
         for error in validation_error.errors():
-            error_type = error.get('type')
-
-            if error_type == 'ghost-edge':
-                self._handle_ghost_edge(error)
-            elif error_type == 'target-missing':
-                self._handle_missing_target(error)
-            elif error_type == 'source-missing':
-                self._handle_missing_source(error)
+            handler = self._ERROR_HANDLERS.get(error['type'])
+            if handler:
+                handler(self, error)
 
     def _handle_ghost_edge(self, error):
         """Handle edges with both source and target missing."""
@@ -65,6 +62,13 @@ class EdgeValidationErrorHandler:
             field_name='source'
         )
 
+    # Handler of each custom error type raised by Edge.validate_endpoints
+    _ERROR_HANDLERS = {
+        'ghost-edge': _handle_ghost_edge,
+        'target-missing': _handle_missing_target,
+        'source-missing': _handle_missing_source,
+    }
+
     def _set_element_info(self, element_id: str, role: str):
         """Get formatted information about an element for error messages."""
         if not self.diagram or not element_id:
@@ -75,12 +79,10 @@ class EdgeValidationErrorHandler:
             node = self.diagram.nodes[element_id]
             return f" {role.capitalize()} is a {node.shape.value} node, label is '{node.label}'"
 
-        # Check if it's a select option (needs to search through nodes)
-        for node in self.diagram.nodes.values():
-            if node.options:
-                for option in node.options:
-                    if option.id == element_id:
-                        return f" {role.capitalize()} is a select option, it's label is '{option.label}' "
+        # Check if it's a select option
+        option = self._get_option_index().get(element_id)
+        if option is not None:
+            return f" {role.capitalize()} is a select option, it's label is '{option.label}' "
 
         # Check if it's a group
         if element_id in self.diagram.groups:
@@ -89,3 +91,14 @@ class EdgeValidationErrorHandler:
             return f" {role.capitalize()} is a group with {element_count} elements, label is '{group.label}'"
 
         return f" {role.capitalize()} ID exists but element not found in diagram"
+
+    def _get_option_index(self):
+        """Get the select options of the diagram by their ID, indexing them once."""
+        if self._option_index is None:
+            self._option_index = {
+                option.id: option
+                for node in self.diagram.nodes.values()
+                if node.options
+                for option in node.options
+            }
+        return self._option_index
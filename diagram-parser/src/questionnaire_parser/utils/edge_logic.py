@@ -6,12 +6,31 @@ handling how edge logic is determined based on the source node type.
 """
 
 import re
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
+
+# Numeric conditions like "Age > 5", "Temperature >= 37.5", etc. No pattern for
+# the text before the operator: search() skips it, a lazy "(.*?)" prefix made
+# labels without a condition quadratic to scan.
+_NUMERIC_CONDITION_RE = re.compile(r"([=<>!]=|[<>])\s*(\d+(?:\.\d+)?)")
+# Text within square brackets [like this]
+_BRACKETED_OPTION_RE = re.compile(r"\[(.*?)\]")
+# Negation of each comparison operator
+_NEGATED_OPERATORS = {
+    "=": "!=",
+    "!=": "=",
+    ">": "<=",
+    "<": ">=",
+    ">=": "<",
+    "<=": ">",
+}
 
 
 class EdgeLogic:
     """Represents a logical condition for an edge."""
 
+    # One per edge and path combination, no per-instance __dict__
+    __slots__ = ("type", "attributes")
+
     def __init__(self, type_: str, **kwargs):
         """Initialize the edge logic.
 
@@ -30,6 +49,26 @@ class EdgeLogic:
         result.update(self.attributes)
         return result
 
+    def __eq__(self, other: object) -> bool:
+        """Two edge logics are equal if they express the same condition."""
+        if not isinstance(other, EdgeLogic):
+            return NotImplemented
+        return self.type == other.type and self.attributes == other.attributes
+
+    def __hash__(self) -> int:
+        """Hash consistent with __eq__: equal edge logics hash the same."""
+        # Attributes compare as a dict, so their order doesn't matter. The
+        # 'conditions' list of an operator is hashed as a tuple.
+        return hash(
+            (
+                self.type,
+                frozenset(
+                    (key, tuple(value) if isinstance(value, list) else value)
+                    for key, value in self.attributes.items()
+                ),
+            )
+        )
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "EdgeLogic":
         """Create an EdgeLogic object from a dictionary."""
@@ -39,16 +78,43 @@ class EdgeLogic:
     @classmethod
     def and_conditions(cls, *conditions: "EdgeLogic") -> "EdgeLogic":
         """Combine multiple conditions with AND logic."""
-        if len(conditions) == 1:
-            return conditions[0]
-        return cls("operator", operation="AND", conditions=list(conditions))
+        return cls._combine("AND", conditions)
 
     @classmethod
     def or_conditions(cls, *conditions: "EdgeLogic") -> "EdgeLogic":
         """Combine multiple conditions with OR logic."""
+        return cls._combine("OR", conditions)
+
+    @classmethod
+    def _combine(
+        cls, operation: str, conditions: Tuple["EdgeLogic", ...]
+    ) -> "EdgeLogic":
+        """Combine conditions with an operation. Operands that are combinations
+        with the same operation are merged in, so combining along a path gives
+        one flat list of conditions instead of a deeper tree at every step.
+        A condition met twice on a path is kept once, AND and OR are idempotent."""
         if len(conditions) == 1:
             return conditions[0]
-        return cls("operator", operation="OR", conditions=list(conditions))
+        flat_conditions: List["EdgeLogic"] = []
+        # Conditions already in flat_conditions, for a constant-time lookup
+        seen = set()
+        for condition in conditions:
+            if (
+                condition.type == "operator"
+                and condition.attributes.get("operation") == operation
+            ):
+                operands = condition.attributes["conditions"]
+            else:
+                operands = [condition]
+            # Append into the new list, never extend a nested operator's list in
+            # place: it may be shared with other paths
+            for operand in operands:
+                if operand not in seen:
+                    seen.add(operand)
+                    flat_conditions.append(operand)
+        if len(flat_conditions) == 1:
+            return flat_conditions[0]
+        return cls("operator", operation=operation, conditions=flat_conditions)
 
 
 class EdgeLogicCalculator:
@@ -106,72 +172,62 @@ class EdgeLogicCalculator:
         Returns:
             EdgeLogic object representing the decision condition
         """
-        # For flag reference in decision point
-        if reference_type == "flag":
-            return self._flag_logic(decision_label, edge_label)
-
-        # Select one reference in decision point
-        elif reference_type == "select_one":
-            return self._select_one_logic(reference_id, decision_label, edge_label)
-
-        # Select multiple reference in decision point
-        elif reference_type == "select_multiple":
-            # Extract option from brackets in decision label
-            option = self._extract_option_from_label(decision_label)
-            if option:
-                return self._select_multiple_logic(reference_id, option)
-
-            # Fallback to basic condition if parsing fails
-            return EdgeLogic(
-                "condition",
-                node=reference_id,
-                operator="=",
-                value=edge_label.lower() == "yes",
-            )
+        handler = self._DECISION_POINT_HANDLERS.get(
+            reference_type, EdgeLogicCalculator._yes_no_logic
+        )
+        return handler(self, reference_id, decision_label, edge_label)
 
-        # Numeric reference (parse equation from label)
-        elif reference_type == "numeric":
-            operator, value = self._parse_numeric_condition(decision_label)
-            if operator and value is not None:
-                # For "No" edge, negate the operator
-                if edge_label.lower() == "no":
-                    operator = self._negate_operator(operator)
+    def _decision_flag_logic(
+        self, reference_id: Optional[str], decision_label: str, edge_label: str
+    ) -> Optional[EdgeLogic]:
+        """Flag reference in decision point"""
+        return self._flag_logic(decision_label, edge_label)
 
-                return EdgeLogic(
-                    "condition", variable=reference_id, operation=operator, value=value
-                )
+    def _decision_select_one_logic(
+        self, reference_id: Optional[str], decision_label: str, edge_label: str
+    ) -> Optional[EdgeLogic]:
+        """Select one reference in decision point"""
+        return self._select_one_logic(reference_id, decision_label, edge_label)
 
-            # Fallback if parsing fails
-            return EdgeLogic(
-                "condition",
-                variable=reference_id,
-                operation="=",
-                value=(edge_label.lower() == "yes"),
-            )
+    def _decision_select_multiple_logic(
+        self, reference_id: Optional[str], decision_label: str, edge_label: str
+    ) -> EdgeLogic:
+        """Select multiple reference in decision point"""
+        # Extract option from brackets in decision label
+        option = self._extract_option_from_label(decision_label)
+        if option:
+            return self._select_multiple_logic(reference_id, option)
+
+        # Fallback to basic condition if parsing fails
+        return self._yes_no_logic(reference_id, decision_label, edge_label)
+
+    def _decision_numeric_logic(
+        self, reference_id: Optional[str], decision_label: str, edge_label: str
+    ) -> EdgeLogic:
+        """Numeric reference (parse equation from label)"""
+        answer = edge_label.lower()
+        operator, value = self._parse_numeric_condition(decision_label)
+        if operator and value is not None:
+            # For "No" edge, negate the operator
+            if answer == "no":
+                operator = self._negate_operator(operator)
 
-        # Select multiple reference (extract option from brackets)
-        elif reference_type == "select_multiple":
-            option = self._extract_option_from_label(decision_label)
-            if option and edge_label.lower() == "yes":
-                return EdgeLogic(
-                    "condition", node=reference_id, operator="contains", value=option
-                )
-            elif option and edge_label.lower() == "no":
-                return EdgeLogic(
-                    "condition",
-                    node=reference_id,
-                    operator="not contains",
-                    value=option,
-                )
-            # Fallback to basic condition if parsing fails
             return EdgeLogic(
-                "condition",
-                node=reference_id,
-                operator="=",
-                value=edge_label.lower() == "yes",
+                "condition", variable=reference_id, operation=operator, value=value
             )
 
-        # Default case - simple yes/no logic
+        # Fallback if parsing fails
+        return EdgeLogic(
+            "condition",
+            variable=reference_id,
+            operation="=",
+            value=(answer == "yes"),
+        )
+
+    def _yes_no_logic(
+        self, reference_id: Optional[str], decision_label: str, edge_label: str
+    ) -> EdgeLogic:
+        """Default case - simple yes/no logic"""
         return EdgeLogic(
             "condition",
             node=reference_id,
@@ -179,6 +235,14 @@ class EdgeLogicCalculator:
             value=edge_label.lower() == "yes",
         )
 
+    # Handler of each reference type of a decision point, others get yes/no logic
+    _DECISION_POINT_HANDLERS = {
+        "flag": _decision_flag_logic,
+        "select_one": _decision_select_one_logic,
+        "select_multiple": _decision_select_multiple_logic,
+        "numeric": _decision_numeric_logic,
+    }
+
     def _negate_operator(self, operator: str) -> str:
         """Negate a comparison operator.
 
@@ -188,15 +252,7 @@ class EdgeLogicCalculator:
         Returns:
             The negated operator
         """
-        negation_map = {
-            "=": "!=",
-            "!=": "=",
-            ">": "<=",
-            "<": ">=",
-            ">=": "<",
-            "<=": ">",
-        }
-        return negation_map.get(operator, operator)
+        return _NEGATED_OPERATORS.get(operator, operator)
 
     def combine_path_logic(
         self, source_logic: Optional[EdgeLogic], added_logic: Optional[EdgeLogic]
@@ -223,9 +279,10 @@ class EdgeLogicCalculator:
         """Calculate logic for select_one node edges.
         If option is missing, a yes/no question is assumed.
         """
-        if edge_label.lower() == "yes":
+        answer = edge_label.lower()
+        if answer == "yes":
             return EdgeLogic("condition", node=node_id, operator="=", value=option)
-        elif edge_label.lower() == "no":
+        elif answer == "no":
             return EdgeLogic("condition", node=node_id, operator="!=", value=option)
         else:
             return None
@@ -239,15 +296,18 @@ class EdgeLogicCalculator:
     ) -> Optional[EdgeLogic]:
         """Calculate logic for edges originating from flag nodes."""
 
+        # An edge without label counts as a "yes"
+        answer = edge_label.lower() if edge_label else "yes"
+
         # Create condition to check if this flag exists in the 'flags' set
-        if not edge_label or edge_label.lower() == "yes":
+        if answer == "yes":
             return EdgeLogic(
                 "condition",
                 variable="flags",  # Reference the global flags set
                 operation="in",  # Check if value is in the set
                 value=flag_label,
             )  # The flag label to check for
-        elif edge_label.lower() == "no":
+        elif answer == "no":
             return EdgeLogic(
                 "condition",
                 variable="flags",  # Reference the global flags set
@@ -268,19 +328,17 @@ class EdgeLogicCalculator:
         Returns:
             Tuple of (operator, value), or (None, None) if parsing fails
         """
-        # Match patterns like "Age > 5", "Temperature >= 37.5", etc.
-        pattern = r"(.*?)(?:\s*)([=<>!]=|[<>])(?:\s*)(\d+(?:\.\d+)?)"
-        match = re.search(pattern, label)
+        match = _NUMERIC_CONDITION_RE.search(label)
 
         if match:
             # Extract the operator and value
-            _, operator, value_str = match.groups()
+            operator, value_str = match.groups()
             try:
                 value = float(value_str)
                 # Convert to integer if it's a whole number
                 if value.is_integer():
                     value = int(value)
-                return operator.strip(), value
+                return operator, value
             except ValueError:
                 pass
 
@@ -295,8 +353,7 @@ class EdgeLogicCalculator:
         Returns:
             Option text, or None if no bracketed text found
         """
-        # Match text within square brackets [like this]
-        match = re.search(r"\[(.*?)\]", label)
+        match = _BRACKETED_OPTION_RE.search(label)
         if match:
             return match.group(1).strip()
         return None
@@ -19,7 +19,7 @@ And three validation modes. You should conceive your validators, so that:
 - LENIENT: Collects all issues without raising exceptions (for debugging purposes)
 """
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional
 import logging
 from pathlib import Path
 from datetime import datetime
@@ -40,6 +40,13 @@ class ValidationLevel(Enum):
     NORMAL = "NORMAL"     # Will raise on CRITICAL, but only collect the other severity levels
     LENIENT = "LENIENT"   # Collect all issues, never raise
 
+# Severities that raise an exception, by validation level
+_RAISING_SEVERITIES = {
+    ValidationLevel.STRICT: frozenset({ValidationSeverity.CRITICAL, ValidationSeverity.ERROR}),
+    ValidationLevel.NORMAL: frozenset({ValidationSeverity.CRITICAL}),
+    ValidationLevel.LENIENT: frozenset(),
+}
+
 class ValidationResult(BaseModel):
     """Represents a single validation issue. This defines how a validation issue will look like."""
     severity: ValidationSeverity
@@ -65,6 +72,10 @@ class ValidationCollector:
         """
         self.validation_level = validation_level
         self.results: List[ValidationResult] = []
+        # The same results grouped by severity, kept up to date by add_result
+        self._results_by_severity: Dict[ValidationSeverity, List[ValidationResult]] = {
+            severity: [] for severity in ValidationSeverity
+        }
 
     def add_result(self,
                   severity: ValidationSeverity,
@@ -92,6 +103,7 @@ class ValidationCollector:
             field_name=field_name
         )
         self.results.append(result)
+        self._results_by_severity[result.severity].append(result)
 
         self._log_result(result)
         self._handle_result(result)
@@ -102,14 +114,14 @@ class ValidationCollector:
         Args:
             result: The validation result to log
         """
-        log_message = self._format_log_message(result)
-
-        if result.severity == ValidationSeverity.CRITICAL:
-            logger.error(log_message)
-        elif result.severity == ValidationSeverity.ERROR:
-            logger.error(log_message)
+        if result.severity == ValidationSeverity.WARNING:
+            log_level = logging.WARNING
         else:
-            logger.warning(log_message)
+            log_level = logging.ERROR
+
+        # Only format the message if it gets logged
+        if logger.isEnabledFor(log_level):
+            logger.log(log_level, self._format_log_message(result))
 
     def _handle_result(self, result: ValidationResult) -> None:
         """Handle the validation result based on validation level.
@@ -120,12 +132,8 @@ class ValidationCollector:
         Raises:
             ValueError: If validation level and severity require an exception
         """
-        if self.validation_level == ValidationLevel.STRICT:
-            if result.severity in [ValidationSeverity.CRITICAL, ValidationSeverity.ERROR]:
-                raise ValueError(self._format_error_message(result))
-        elif self.validation_level == ValidationLevel.NORMAL:
-            if result.severity == ValidationSeverity.CRITICAL:
-                raise ValueError(self._format_error_message(result))
+        if result.severity in _RAISING_SEVERITIES.get(self.validation_level, ()):
+            raise ValueError(self._format_error_message(result))
 
     def save_report(self, output_path: Path) -> None:
         """Save validation results to a file.
@@ -158,22 +166,23 @@ class ValidationCollector:
         Args:
             file: File object to write to
         """
-        for severity in ValidationSeverity:
-            results = [r for r in self.results if r.severity == severity]
+        # Collect the lines of all results and write them at once
+        parts = []
+        for severity, results in self._results_by_severity.items():
             if results:
-                file.write(f"\n{severity.value} Issues ({len(results)}):\n")
-                file.write("-" * 30 + "\n")
+                parts.append(f"\n{severity.value} Issues ({len(results)}):\n")
+                parts.append("-" * 30 + "\n")
 
                 for result in results:
-                    file.write(f"- {result.message}\n")
+                    parts.append(f"- {result.message}\n")
                     if result.element_id:
-                        file.write(f"  Element ID: {result.element_id}\n")
+                        parts.append(f"  Element ID: {result.element_id}\n")
                     if result.element_type:
-                        file.write(f"  Element Type: {result.element_type}\n")
+                        parts.append(f"  Element Type: {result.element_type}\n")
                     if result.field_name:
-                        file.write(f"  Field: {result.field_name}\n")
-                    file.write(f"  Time: {result.timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    file.write("\n")
+                        parts.append(f"  Field: {result.field_name}\n")
+                    parts.append(f"  Time: {result.timestamp:%Y-%m-%d %H:%M:%S}\n\n")
+        file.write("".join(parts))
 
     def _write_report_summary(self, file) -> None:
         """Write the summary section of the validation report.
@@ -183,9 +192,8 @@ class ValidationCollector:
         """
         file.write("\nSummary:\n")
         file.write("-" * 30 + "\n")
-        for severity in ValidationSeverity:
-            count = len([r for r in self.results if r.severity == severity])
-            file.write(f"{severity.value}: {count} issues\n")
+        for severity, results in self._results_by_severity.items():
+            file.write(f"{severity.value}: {len(results)} issues\n")
 
         if self.has_critical_issues:
             file.write("\nWARNING: Critical issues were found!\n")
@@ -230,7 +238,7 @@ class ValidationCollector:
         Returns:
             List of validation results with the specified severity
         """
-        return [r for r in self.results if r.severity == severity]
+        return list(self._results_by_severity[severity])
 
     @property
     def has_critical_issues(self) -> bool:
@@ -239,4 +247,4 @@ class ValidationCollector:
         Returns:
             True if there are any CRITICAL issues, False otherwise
         """
-        return any(r.severity == ValidationSeverity.CRITICAL for r in self.results)
+        return bool(self._results_by_severity[ValidationSeverity.CRITICAL])
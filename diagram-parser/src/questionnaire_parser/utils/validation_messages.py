@@ -34,22 +34,16 @@ class EdgeValidationMessage(Enum):
             A formatted, user-friendly error message
         """
         error_type = error_details['type']
-        field_name = '.'.join(str(loc) for loc in error_details['loc'])
+        field_name = '.'.join(map(str, error_details['loc']))
         edge_id = cell.get('id')
         source_id = cell.get('source') # attempt to read source id from the edge
         target_id = cell.get('target') # attempt to read target id from the edge
 
 
-        # Choose the appropriate message template based on the error type
-        # if there is no source but there is a target:
-        if error_type == 'string_type' and error_details.get('input') is None and not source_id and target_id:
-            message_template = cls.NONE_ERROR_SOURCE.value
-        # if there is no target but there is a source:
-        elif error_type == 'string_type' and error_details.get('input') is None and source_id and not target_id:
-            message_template = cls.NONE_ERROR_TARGET.value
-        else:
-            # For unhandled error types, use the general format
-            message_template = cls.INVALID_GENERAL.value
+        # Choose the appropriate message template based on the error type,
+        # for unhandled error types, use the general format
+        template_key = (error_type, error_details.get('input') is None, bool(source_id), bool(target_id))
+        message_template = _MESSAGE_TEMPLATES.get(template_key, cls.INVALID_GENERAL.value)
 
         # Format the chosen template with the provided values
         return message_template.format(
@@ -59,3 +53,12 @@ class EdgeValidationMessage(Enum):
             target_id=target_id,
             error_msg=error_details.get('msg', '')
         )
+
+
+# Message template by (error type, input is missing, has source, has target)
+_MESSAGE_TEMPLATES = {
+    # if there is no source but there is a target:
+    ('string_type', True, False, True): EdgeValidationMessage.NONE_ERROR_SOURCE.value,
+    # if there is no target but there is a source:
+    ('string_type', True, True, False): EdgeValidationMessage.NONE_ERROR_TARGET.value,
+}
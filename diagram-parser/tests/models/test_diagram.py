@@ -0,0 +1,60 @@
+import pytest
+from pydantic import ValidationError
+
+from questionnaire_parser.models.diagram import (
+    Diagram,
+    Edge,
+    ElementMetadata,
+    Geometry,
+    Node,
+    ShapeType,
+    Style,
+)
+
+
+def make_node(node_id: str, shape: ShapeType = ShapeType.RECTANGLE, name=None) -> Node:
+    metadata = ElementMetadata(name=name) if name else None
+    return Node(
+        id=node_id, shape=shape, geometry=Geometry(), style=Style(), metadata=metadata
+    )
+
+
+def make_diagram(node_ids, edges) -> Diagram:
+    """Diagram of rectangle nodes, edges given as (source, target) pairs"""
+    return Diagram(
+        nodes={node_id: make_node(node_id) for node_id in node_ids},
+        edges={
+            f"e{i}": Edge(id=f"e{i}", source=source, target=target)
+            for i, (source, target) in enumerate(edges)
+        },
+    )
+
+
+class TestValidateDag:
+    def test_acyclic_diamond(self):
+        diagram = make_diagram("abcd", [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")])
+        assert diagram.validate_dag()
+
+    def test_self_loop(self):
+        diagram = make_diagram("ab", [("a", "b"), ("b", "b")])
+        assert not diagram.validate_dag()
+
+    def test_cycle_not_reachable_from_entry_point(self):
+        # a is the only entry point, c and d only reach each other
+        diagram = make_diagram("abcd", [("a", "b"), ("c", "d"), ("d", "c")])
+        assert not diagram.validate_dag()
+
+    def test_long_chain(self):
+        # Longer than the recursion limit, the search must not recurse
+        node_ids = [f"n{i}" for i in range(5000)]
+        diagram = make_diagram(node_ids, list(zip(node_ids, node_ids[1:])))
+        assert diagram.validate_dag()
+
+
+def test_rhombus_with_missing_reference_raises_without_collector():
+    rhombus = make_node("r", shape=ShapeType.RHOMBUS, name="missing_reference")
+    with pytest.raises(
+        ValidationError,
+        match="Rhombus node r references non-existent node missing_reference",
+    ):
+        Diagram(nodes={"r": rhombus})
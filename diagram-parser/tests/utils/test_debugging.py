@@ -0,0 +1,24 @@
+from lxml import etree as ET
+
+from questionnaire_parser.utils.debugging import (
+    print_xml_structure,
+    stream_xml_structure,
+)
+
+
+def test_stream_xml_structure_with_leading_comment(tmp_path, capsys):
+    xml = (
+        '<?xml version="1.0"?>\n'
+        '<?xml-stylesheet type="text/xsl" href="style.xsl"?>\n'
+        "<!-- leading comment -->\n"
+        '<mxfile host="app"><diagram id="d">text<mxCell id="0"/>'
+        '<mxCell id="1" parent="0"/></diagram></mxfile>'
+    )
+    xml_path = tmp_path / "diagram.drawio"
+    xml_path.write_text(xml)
+
+    stream_xml_structure(xml_path)
+    streamed = capsys.readouterr().out
+
+    print_xml_structure(ET.parse(str(xml_path)).getroot())
+    assert streamed == capsys.readouterr().out
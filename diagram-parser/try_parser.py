@@ -1,14 +1,51 @@
+import argparse
+import cProfile
 import logging
+import pstats
 from pathlib import Path
-from questionnaire_parser.utils.debugging import debug_parsing, debug_converting_to_dag
-from questionnaire_parser.core.parser import ValidationLevel
 
+# Defaults, relative to the repository root
+DEFAULT_XML_PATH = Path("diagram-parser/tests/test_data/valid_diagrams/dx_without_pictures.drawio")
+DEFAULT_EXTERNALS_PATH = Path("diagram-parser/src/questionnaire_parser/business_rules/externals.json")
 
-if __name__ == "__main__":
-    # Replace with path to your test draw.io file
-    xml_path = Path("diagram-parser/tests/test_data/valid_diagrams/dx_without_pictures.drawio")
-    externals_path = Path("diagram-parser/src/questionnaire_parser/business_rules/externals.json")
-    diagram, validator = debug_parsing(xml_path, externals_path, validation_level = ValidationLevel.LENIENT, logging_level=logging.INFO)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Parse a draw.io file and convert it to a DAG, with debug output.")
+    parser.add_argument("--xml", type=Path, default=DEFAULT_XML_PATH, help="draw.io file to parse")
+    parser.add_argument("--externals", type=Path, default=DEFAULT_EXTERNALS_PATH, help="externals.json with the allowed external references")
+    parser.add_argument("--validation", choices=["strict", "normal", "lenient"], default="lenient", help="validation level (default: lenient)")
+    parser.add_argument("--log-level", choices=["DEBUG", "INFO", "WARNING", "ERROR"], default="INFO", help="logging level (default: INFO)")
+    parser.add_argument("--profile", type=Path, nargs="?", const=Path("try_parser.pstats"), metavar="STATS_FILE",
+                        help="profile parsing and DAG conversion, print the 30 slowest calls by cumulative time "
+                             "and save the stats (default: try_parser.pstats, e.g. for snakeviz)")
+    return parser.parse_args()
+
+
+def run(args):
+    # Imported after the arguments are parsed, so --help doesn't load the whole parser stack
+    from questionnaire_parser.utils.debugging import debug_parsing, debug_converting_to_dag
+    from questionnaire_parser.core.parser import ValidationLevel
+
+    diagram, validator = debug_parsing(args.xml, args.externals, validation_level = ValidationLevel[args.validation.upper()], logging_level=getattr(logging, args.log_level))
     dag = debug_converting_to_dag(diagram, validator)
 
     print('reached end of code')
+
+
+def main():
+    args = parse_args()
+    if not args.profile:
+        run(args)
+        return
+
+    # The imports are part of the profile, they are a good share of a short run
+    with cProfile.Profile() as profiler:
+        run(args)
+    stats = pstats.Stats(profiler).strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE)
+    stats.print_stats(30)
+    stats.dump_stats(args.profile)
+    print(f"Profile saved to {args.profile}")
+
+
+if __name__ == "__main__":
+    main()